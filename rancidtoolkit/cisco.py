@@ -6,16 +6,18 @@
 Cisco specific parsing of configuration files
 """
 
-import ipaddr
 import re
+from . import limits
 
 def section(filename, section):
     """returns a list with all configuration within section from filename"""
+    limits.checkFileSize(filename)
     fh = open(filename)
     ret = []
     insec = False
     spaces = ""
     secret = []
+    nodes = 0
 
     for line in fh:
         line = line[:-1]
@@ -36,6 +38,8 @@ def section(filename, section):
                 # match old section is over, save section
                 ret = ret + [secret]
                 insec = False
+            nodes += 1
+            limits.checkNodes(filename, nodes)
             secret = secret + [line]      # save to current section
     return ret
 
@@ -131,6 +135,8 @@ def addresses(filename, with_subnetsize=None):
                 if reobj:
                     afi = reobj.group(1)
                     if afi == "ip" and with_subnetsize:
+                        # ipaddr is slow to load, only import it when needed
+                        import ipaddr
                         ip = reobj.group(2).split(" ")[0]
                         if ipaddr.IPAddress(ip).version is not 4:
                             continue
@@ -6,19 +6,168 @@ Juniper specific parsing of configuration files
 
 import sys
 import re
+import itertools
+from . import limits
 
 
-def parseFile(filename):
+CHUNKSIZE = 64 * 1024
+
+
+def parseFile(filename, chunksize=CHUNKSIZE):
     """ reads config file """
-    flatconfig = ""
-    for line in open(filename):
-        line = line[:-1]
-        if re.match("^#", line):
+    limits.checkFileSize(filename)
+    fh = open(filename)
+    try:
+        return parseChunks(flattenFile(fh, chunksize), filename)
+    finally:
+        fh.close()
+
+
+def readChunks(fh, chunksize, atlinestart=True):
+    """ reads fh in pieces of at most chunksize characters and yields
+    (position, piece) for them with comment lines and line ends removed """
+    skipline = False
+    while True:
+        position = fh.tell()
+        chunk = fh.readline(chunksize)
+        if chunk == "":
+            return
+        if atlinestart:
+            skipline = chunk.startswith("#")
+        atlinestart = chunk.endswith("\n")
+        if skipline:
             continue
-        flatconfig += line
-    flatconfig = re.sub("\/\*.*?\*\/", " ", flatconfig)
-    flatconfig = re.sub("\s+", " ", flatconfig)
-    return parseString(flatconfig + "}")[0]
+        if atlinestart:
+            chunk = chunk[:-1]
+        yield (position, chunk)
+
+
+def collapseWhitespace(text, lastblank):
+    """ collapses whitespace in text to a single blank, dropping a leading
+    blank if the text before ended with one, returns (text, lastblank) """
+    flat = re.sub("\s+", " ", text)
+    if lastblank and flat.startswith(" "):
+        flat = flat[1:]
+    if flat:
+        lastblank = flat.endswith(" ")
+    return (flat, lastblank)
+
+
+def flattenFile(fh, chunksize=CHUNKSIZE):
+    """ reads config from fh in pieces of at most chunksize characters and
+    yields them with comment lines and /* */ comments removed and whitespace
+    collapsed, lines are joined without separator """
+    incomment = False
+    commentstart = None
+    pending = ""
+    pendingstart = None
+    lastblank = False
+    for (position, chunk) in readChunks(fh, chunksize):
+        text = pending + chunk
+        carried = len(pending)
+        pending = ""
+        out = []
+        pos = 0
+        while True:
+            if incomment:
+                end = text.find("*/", pos)
+                if end < 0:
+                    # keep a trailing * as it may start the end of comment
+                    if len(text) > pos and text.endswith("*"):
+                        pending = "*"
+                    break
+                out.append(" ")
+                pos = end + 2
+                incomment = False
+            else:
+                start = text.find("/*", pos)
+                if start < 0:
+                    # keep a trailing / as it may start a comment
+                    if len(text) > pos and text.endswith("/"):
+                        out.append(text[pos:-1])
+                        pending = "/"
+                        if chunk:
+                            pendingstart = (position, len(chunk) - 1)
+                    else:
+                        out.append(text[pos:])
+                    break
+                out.append(text[pos:start])
+                # remember where the comment starts instead of its text
+                if start < carried:
+                    commentstart = pendingstart
+                else:
+                    commentstart = (position, start - carried)
+                pos = start + 2
+                incomment = True
+        (flat, lastblank) = collapseWhitespace("".join(out), lastblank)
+        if flat:
+            yield flat
+    if incomment:
+        # a comment that is never closed is kept as it is, read it again
+        fh.seek(commentstart[0])
+        skip = commentstart[1]
+        for (position, chunk) in readChunks(fh, chunksize, False):
+            (flat, lastblank) = collapseWhitespace(chunk[skip:], lastblank)
+            skip = 0
+            if flat:
+                yield flat
+    elif pending:
+        (flat, lastblank) = collapseWhitespace(pending, lastblank)
+        if flat:
+            yield flat
+
+
+def parseChunks(chunks, filename=""):
+    """ builds the configtree from the flattened config pieces in chunks,
+    checking the node and depth limits on the way """
+    configtree = {}
+    stack = [configtree]
+    elem = []
+    content = False
+    # statements since the last bracket, they take precedence over a section
+    # of the same name like they do in parseString
+    statements = set()
+    nodes = 0
+    # the top level is closed by an additional closing bracket at the end
+    for chunk in itertools.chain(chunks, ["}"]):
+        for token in re.split("([{};])", chunk):
+            if token == "":
+                continue
+            if token not in ("{", "}", ";"):
+                elem.append(token)
+                content = True
+                continue
+            key = "".join(elem).strip()
+            elem = []
+            if token == "{" and content:
+                nodes += 1
+                limits.checkNodes(filename, nodes)
+                limits.checkDepth(filename, len(stack))
+                if key in statements:
+                    stack.append({})
+                else:
+                    stack[-1][key] = {}
+                    stack.append(stack[-1][key])
+                content = False
+                statements = set()
+                continue
+            if key:
+                nodes += 1
+                limits.checkNodes(filename, nodes)
+                stack[-1][key] = "filled"
+                statements.add(key)
+            if token == ";":
+                content = True
+                continue
+            # closing bracket (or opening bracket without content) ends the
+            # current section
+            stack.pop()
+            if not stack:
+                return configtree
+            content = False
+            statements = set()
+    print "Unmatched configuration string"
+    sys.exit(2)
 
 
 def parseString(flatconfig):
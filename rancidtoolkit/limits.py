@@ -0,0 +1,50 @@
+"""
+Per-file limits for parsing configuration files, so a single pathological
+config cannot exhaust memory. Set a limit to None to disable it.
+"""
+
+import os.path
+
+# maximum size of a configuration file in bytes
+MAX_FILESIZE = 64 * 1024 * 1024
+# maximum number of configuration statements/lines kept per file
+MAX_NODES = 1000000
+# maximum nesting depth of a configuration (Juniper only)
+MAX_DEPTH = 64
+
+
+class ConfigLimitError(Exception):
+    """ raised when a configuration file exceeds one of the limits """
+    pass
+
+
+def setLimits(filesize=False, nodes=False, depth=False):
+    """ sets the limits, arguments not given are left unchanged """
+    global MAX_FILESIZE, MAX_NODES, MAX_DEPTH
+    if filesize is not False:
+        MAX_FILESIZE = filesize
+    if nodes is not False:
+        MAX_NODES = nodes
+    if depth is not False:
+        MAX_DEPTH = depth
+
+
+def checkFileSize(filename):
+    """ raises ConfigLimitError if filename is larger than MAX_FILESIZE """
+    if MAX_FILESIZE is not None and os.path.getsize(filename) > MAX_FILESIZE:
+        raise ConfigLimitError("%s exceeds maximum file size of %d bytes" %
+                               (filename, MAX_FILESIZE))
+
+
+def checkNodes(filename, nodes):
+    """ raises ConfigLimitError if nodes is more than MAX_NODES """
+    if MAX_NODES is not None and nodes > MAX_NODES:
+        raise ConfigLimitError("%s exceeds maximum of %d statements" %
+                               (filename, MAX_NODES))
+
+
+def checkDepth(filename, depth):
+    """ raises ConfigLimitError if depth is more than MAX_DEPTH """
+    if MAX_DEPTH is not None and depth > MAX_DEPTH:
+        raise ConfigLimitError("%s exceeds maximum nesting depth of %d" %
+                               (filename, MAX_DEPTH))
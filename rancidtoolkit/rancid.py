@@ -10,8 +10,33 @@ independant calling of functions
 import sys
 import re
 import os.path
-from . import cisco
-from . import juniper
+import importlib
+from . import limits
+
+
+def vendorModule(name):
+    """ returns the parser module for vendor name, the module is only
+    imported on first use """
+    return importlib.import_module("." + name, __name__.rpartition(".")[0])
+
+
+def defaultLocations():
+    """ returns (base, locations) defaults for this platform, the platform
+    check is only done once """
+    if defaultLocations.cache is None:
+        # FIXME dirty hack for local dev copy
+        if sys.platform == "darwin":
+            defaultLocations.cache = ("/Users/lysis/share/rancid",
+                                      ["darmstadt", "frankfurt", "wiesbaden",
+                                       "amsterdam", "momus", "test", "hmwk",
+                                       "tiz"])
+        else:
+            defaultLocations.cache = ("/home/rancid/var",
+                                      ["darmstadt", "frankfurt", "wiesbaden",
+                                       "amsterdam", "momus", "tiz"])
+    return defaultLocations.cache
+
+defaultLocations.cache = None
 
 
 class RancidConfig(object):
@@ -26,16 +51,9 @@ class RancidConfig(object):
     def __init__(self, locations=None, rancid_base=""):
         super(RancidConfig, self).__init__()
         if locations is None and rancid_base == "":
-            # FIXME dirty hack for local dev copy
-            if sys.platform == "darwin":
-                self.BASE = "/Users/lysis/share/rancid"
-                self.LOCATIONS = ["darmstadt", "frankfurt", "wiesbaden",
-                                  "amsterdam", "momus", "test", "hmwk",
-                                  "tiz"]
-            else:
-                self.BASE = "/home/rancid/var"
-                self.LOCATIONS = ["darmstadt", "frankfurt", "wiesbaden",
-                                  "amsterdam", "momus", "tiz"]
+            (base, locations) = defaultLocations()
+            self.BASE = base
+            self.LOCATIONS = list(locations)
         else:
             if type(locations) == list:
                 self.LOCATIONS = locations
@@ -157,14 +175,17 @@ class Rancid(object):
 
         intlist = dict()
 
-        if routertype == "cisco":
-            intlist = cisco.interfaces(filename)
-        elif routertype == "force10":
-            intlist = cisco.interfaces(filename)
-        elif routertype == "juniper":
-            intlist = juniper.interfaces(filename)
-        else:
-            print "Unknown type", routertype, "in", filename
+        try:
+            if routertype == "cisco":
+                intlist = vendorModule("cisco").interfaces(filename)
+            elif routertype == "force10":
+                intlist = vendorModule("cisco").interfaces(filename)
+            elif routertype == "juniper":
+                intlist = vendorModule("juniper").interfaces(filename)
+            else:
+                print "Unknown type", routertype, "in", filename
+        except limits.ConfigLimitError as e:
+            return [str(e)]
 
         ret = []
         for interface in intlist.keys():
@@ -194,14 +215,16 @@ class Rancid(object):
             return {"error": "Cannot find device " + device +
                     " in rancid configuration."}
 
-        if routertype == "cisco":
-            return cisco.interfaces(filename)
-        elif routertype == "force10":
-            return cisco.interfaces(filename)
-        elif routertype == "juniper":
-            return juniper.interfaces(filename)
-        else:
-            return {"error": "Unknown type " + routertype + " in " + filename}
+        try:
+            if routertype == "cisco":
+                return vendorModule("cisco").interfaces(filename)
+            elif routertype == "force10":
+                return vendorModule("cisco").interfaces(filename)
+            elif routertype == "juniper":
+                return vendorModule("juniper").interfaces(filename)
+        except limits.ConfigLimitError as e:
+            return {"error": str(e)}
+        return {"error": "Unknown type " + routertype + " in " + filename}
 
     def interfaceAddressList(self, device, with_subnetsize=None):
         """ returns a dict {interface:{"ip": address, "ipv6": address}} for
@@ -212,14 +235,19 @@ class Rancid(object):
             return {"error": "Cannot find device " + device +
                     " in rancid configuration."}
 
-        if routertype == "cisco":
-            return cisco.addresses(filename, with_subnetsize)
-        elif routertype == "force10":
-            return cisco.addresses(filename, with_subnetsize)
-        elif routertype == "juniper":
-            return juniper.addresses(filename, with_subnetsize)
-        else:
-            return {"error": "Unknown type " + routertype + " in " + filename}
+        try:
+            if routertype == "cisco":
+                return vendorModule("cisco").addresses(filename,
+                                                       with_subnetsize)
+            elif routertype == "force10":
+                return vendorModule("cisco").addresses(filename,
+                                                       with_subnetsize)
+            elif routertype == "juniper":
+                return vendorModule("juniper").addresses(filename,
+                                                         with_subnetsize)
+        except limits.ConfigLimitError as e:
+            return {"error": str(e)}
+        return {"error": "Unknown type " + routertype + " in " + filename}
 
     def interfaceVrfList(self, device):
         """ returns a dict {interface:{"vrf": name}} for
@@ -230,27 +258,34 @@ class Rancid(object):
             return {"error": "Cannot find device " + device +
                     " in rancid configuration."}
 
-        if routertype == "cisco":
-            return cisco.vrfs(filename)
-        # no support for discovering Juniper VRFs #FIXME
-        # elif routertype == "juniper":
-        #   return juniper.addresses(filename, with_subnetsize)
-        else:
-            return {"error": "Unknown type " + routertype + " in " + filename}
+        try:
+            if routertype == "cisco":
+                return vendorModule("cisco").vrfs(filename)
+            # no support for discovering Juniper VRFs #FIXME
+            # elif routertype == "juniper":
+            #   return juniper.addresses(filename, with_subnetsize)
+        except limits.ConfigLimitError as e:
+            return {"error": str(e)}
+        return {"error": "Unknown type " + routertype + " in " + filename}
 
     def printFilterSection(self, filename, filterstr):
         """ filters the config for filename according to filterstr and prints
         it in a nice way """
-        if filename[1] == "juniper":
-            sections = juniper.section(filename[0], filterstr)
-            juniper.printSection(sections)
-        else:
-            sections = cisco.section(filename[0], ".* ".join(filterstr))
-            cisco.printSection(sections)
+        try:
+            if filename[1] == "juniper":
+                juniper = vendorModule("juniper")
+                sections = juniper.section(filename[0], filterstr)
+                juniper.printSection(sections)
+            else:
+                cisco = vendorModule("cisco")
+                sections = cisco.section(filename[0], ".* ".join(filterstr))
+                cisco.printSection(sections)
+        except limits.ConfigLimitError as e:
+            print str(e)
 
     def printSection(self, vendor, section):
         """ prints section in a nice way """
         if vendor == "juniper":
-            juniper.printSection(section)
+            vendorModule("juniper").printSection(section)
         else:
-            cisco.printSection(section)
+            vendorModule("cisco").printSection(section)
@@ -0,0 +1,50 @@
+"""
+Import time budget for rancidtoolkit.rancid, vendor modules and ipaddr have
+to stay out of the import
+"""
+
+import os.path
+import subprocess
+import sys
+
+# seconds importing rancidtoolkit.rancid may take on top of importing the
+# package with only its limits module, loading cisco and juniper as well
+# adds more than twice that
+IMPORT_MARGIN = 0.002
+# fresh interpreters to run, the fastest one is used
+IMPORT_RUNS = 5
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = """
+import sys
+import time
+import re, os.path, importlib
+start = time.time()
+import rancidtoolkit.limits
+baseline = time.time() - start
+start = time.time()
+import rancidtoolkit.rancid
+print(time.time() - start - baseline)
+print(" ".join(sorted(sys.modules)))
+"""
+
+
+def importRancid():
+    """ imports rancidtoolkit.rancid in a fresh interpreter and returns
+    (seconds, modules), seconds is the time taken over importing the
+    package with only its limits module in the same interpreter """
+    out = subprocess.check_output([sys.executable, "-c", SCRIPT], cwd=ROOT)
+    (seconds, modules) = out.decode().strip().split("\n")
+    return (float(seconds), modules.split(" "))
+
+
+def test_import_is_lazy():
+    modules = importRancid()[1]
+    for module in ("rancidtoolkit.cisco", "rancidtoolkit.juniper", "ipaddr"):
+        assert module not in modules
+
+
+def test_import_time_budget():
+    seconds = min(importRancid()[0] for run in range(IMPORT_RUNS))
+    assert seconds < IMPORT_MARGIN
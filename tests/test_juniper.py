@@ -0,0 +1,126 @@
+"""
+Tests for the streaming Juniper parser against the flattening parseFile used
+before, and for the per-file limits
+"""
+
+import re
+
+import pytest
+
+from rancidtoolkit import juniper, limits
+
+CHUNKSIZES = [1, 2, 3, 7, juniper.CHUNKSIZE]
+
+CONFIGS = [
+    # comments and comment lines
+    "# comment line\nsystem {\n    host-name r1;\n}\n",
+    "system { /* comment { ; } */ host-name r1; }\n",
+    "system {\n/* comment\n spanning { lines } */\n host-name r1;\n}\n",
+    "#" + "x" * 20 + " {\nsystem { host-name r1; }\n",
+    "a;\n#\n#{\nb;\n",
+    # / and * on both sides of a line end or chunk boundary
+    "a;/\n*b;*/c;\n",
+    "a;/*b*\n/c;\n",
+    "a/*/b*/c;\n",
+    "a;//**/b;\n",
+    "a;/*b;**/c;/\n",
+    # whitespace across lines and chunks
+    "a  \n   b;\n\t c \t\n;\n",
+    "interfaces {\n    ge-0/0/0 {\n        description \"a  b\";\n"
+    "        unit 0 {\n            family inet {\n"
+    "                address 10.0.0.1/24;\n            }\n        }\n"
+    "    }\n}\n",
+    # duplicate keys, statements before a section of the same name win
+    "x; x { y; }\n",
+    "x { y; } x;\n",
+    "x { y; } x { z; }\n",
+    # unterminated comments are kept as they are
+    "a; /* b { c; }\n",
+    "a;/\n*b;\n",
+    "a { b; /* c;\n  d; }\n",
+    # opening bracket without content and unmatched closing bracket
+    "{a;}\n",
+    "a { b; } } c;\n",
+]
+
+
+def referenceParse(text):
+    """ parses text like parseFile did before flattenFile, the last line
+    is kept whole even without line end """
+    flatconfig = ""
+    for line in text.split("\n"):
+        if re.match("^#", line):
+            continue
+        flatconfig += line
+    flatconfig = re.sub(r"\/\*.*?\*\/", " ", flatconfig)
+    flatconfig = re.sub(r"\s+", " ", flatconfig)
+    return juniper.parseString(flatconfig + "}")[0]
+
+
+def writeConfig(tmpdir, text):
+    configfile = tmpdir.join("router")
+    configfile.write(text)
+    return str(configfile)
+
+
+@pytest.fixture
+def restoreLimits():
+    saved = (limits.MAX_FILESIZE, limits.MAX_NODES, limits.MAX_DEPTH)
+    yield
+    limits.setLimits(*saved)
+
+
+@pytest.mark.parametrize("chunksize", CHUNKSIZES)
+@pytest.mark.parametrize("text", CONFIGS)
+def test_parseFile_matches_parseString(tmpdir, text, chunksize):
+    filename = writeConfig(tmpdir, text)
+    assert juniper.parseFile(filename, chunksize) == referenceParse(text)
+
+
+@pytest.mark.parametrize("chunksize", CHUNKSIZES)
+def test_parseFile_keeps_last_line_without_line_end(tmpdir, chunksize):
+    # the old parseFile dropped the last character of such a file
+    filename = writeConfig(tmpdir, "a;\nb")
+    assert juniper.parseFile(filename, chunksize) == {"a": "filled",
+                                                      "b": "filled"}
+
+
+def test_parseFile_structure(tmpdir):
+    filename = writeConfig(tmpdir, CONFIGS[11])
+    assert juniper.parseFile(filename) == {
+        "interfaces": {"ge-0/0/0": {
+            "description \"a b\"": "filled",
+            "unit 0": {"family inet": {"address 10.0.0.1/24": "filled"}}}}}
+
+
+def test_depth_limit(tmpdir, restoreLimits):
+    filename = writeConfig(tmpdir, "a {" * 5 + "}" * 5 + "\n")
+    limits.setLimits(depth=5)
+    assert len(juniper.parseFile(filename)) == 1
+    limits.setLimits(depth=4)
+    with pytest.raises(limits.ConfigLimitError):
+        juniper.parseFile(filename)
+
+
+def test_node_limit(tmpdir, restoreLimits):
+    filename = writeConfig(tmpdir, "p {\n a;\n b;\n c;\n}\n")
+    limits.setLimits(nodes=4)
+    assert len(juniper.parseFile(filename)["p"]) == 3
+    limits.setLimits(nodes=3)
+    with pytest.raises(limits.ConfigLimitError):
+        juniper.parseFile(filename)
+
+
+def test_filesize_limit(tmpdir, restoreLimits):
+    filename = writeConfig(tmpdir, "a;\n" * 10)
+    limits.setLimits(filesize=30)
+    assert len(juniper.parseFile(filename)) == 1
+    limits.setLimits(filesize=29)
+    with pytest.raises(limits.ConfigLimitError):
+        juniper.parseFile(filename)
+
+
+def test_no_limits(tmpdir, restoreLimits):
+    filename = writeConfig(tmpdir, "a {" * 100 + "}" * 100 + "\n")
+    limits.setLimits(filesize=None, nodes=None, depth=None)
+    assert len(juniper.parseFile(filename)) == 1